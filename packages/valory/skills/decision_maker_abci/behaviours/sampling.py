@@ -21,7 +21,7 @@
 
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from typing import Dict, Generator, Iterable, List, NamedTuple, Optional, Tuple
 
 from packages.valory.skills.decision_maker_abci.behaviours.base import (
     DecisionMakerBaseBehaviour,
@@ -37,6 +37,123 @@ from packages.valory.skills.market_manager_abci.graph_tooling.requests import (
 WEEKDAYS = 7
 UNIX_DAY = 60 * 60 * 24
 UNIX_WEEK = WEEKDAYS * UNIX_DAY
+# the queue statuses to sample from, in decreasing order of priority
+SAMPLING_QUEUE_PRIORITY = (
+    QueueStatus.TO_PROCESS,
+    QueueStatus.PROCESSED,
+    QueueStatus.REPROCESSED,
+)
+PROCESSABLE_STATUSES = frozenset(SAMPLING_QUEUE_PRIORITY)
+QUEUE_STATUS_RANK = {
+    status: rank for rank, status in enumerate(SAMPLING_QUEUE_PRIORITY)
+}
+PriorityKeyType = Tuple[int, int, float, int]
+
+
+class SamplingConditions(NamedTuple):
+    """The conditions, common to all the bets, that determine whether a bet is processable."""
+
+    # the latest opening timestamp that is within the sampling range
+    opening_cutoff: int
+    # the opening timestamp that a bet needs to exceed to be within the safe voting range
+    safe_cutoff: int
+    # whether the bets are being reviewed for selling
+    selling_specific: bool
+    # whether the multi-bets mode is being used
+    multi_bets_mode: bool
+
+
+def processable_bet(bet: Bet, conditions: SamplingConditions) -> bool:
+    """
+    Whether we can process the given bet.
+
+    :param bet: the bet to check.
+    :param conditions: the sampling conditions, common to all the bets.
+    :return: whether the bet is processable.
+    """
+    if bet.queue_status.is_expired():
+        return False
+
+    bets_placed = bet.n_bets > 0
+    if not bets_placed and conditions.selling_specific:
+        # non-expired bet with no bets, not processable
+        return False
+
+    bet_mode_allowable = (
+        conditions.multi_bets_mode or not bets_placed or conditions.selling_specific
+    )
+
+    opening_timestamp = bet.openingTimestamp
+    within_opening_range = opening_timestamp <= conditions.opening_cutoff
+    within_safe_range = conditions.safe_cutoff < opening_timestamp
+    if not within_safe_range:
+        bet.blacklist_forever()
+
+    within_ranges = within_opening_range and within_safe_range
+
+    # check if bet queue number is processable
+    bet_queue_processable = bet.queue_status in PROCESSABLE_STATUSES
+
+    return bet_mode_allowable and within_ranges and bet_queue_processable
+
+
+def priority_key(bet: Bet) -> PriorityKeyType:
+    """
+    Get the key of the given bet based on the priority logic.
+
+    :param bet: the bet to get the key for.
+    :return: the key of the bet; the higher the key, the higher the priority.
+    """
+    return (
+        bet.invested_amount,
+        -bet.processed_timestamp,  # Increasing order of processed_timestamp
+        bet.scaledLiquidityMeasure,
+        bet.openingTimestamp,
+    )
+
+
+def sampled_bet_idx(
+    bets: Iterable[Tuple[int, Bet]],
+    conditions: Optional[SamplingConditions] = None,
+) -> Optional[int]:
+    """
+    Sample a bet and return its index.
+
+    The sampling logic follows the specified priority logic:
+    1. Skip the bets that are not processable under the given conditions, if any.
+    2. Group the remaining bets by queue status and sample from the first non-empty group,
+       in the order TO_PROCESS, PROCESSED, REPROCESSED; bets with any other queue status are skipped.
+    3. Within the group, sample the bet with the highest priority key, i.e.:
+       3.1 The highest invested_amount first.
+       3.2 For bets with the same invested_amount, the least recently processed first (lowest processed_timestamp).
+       3.3 For bets with the same invested_amount and processed_timestamp, the highest liquidity first.
+       3.4 For bets with the same invested_amount, processed_timestamp, and liquidity,
+           the latest market closing time first (highest openingTimestamp).
+    4. For bets with the same priority key, the first one is sampled.
+
+    :param bets: the bets to sample from, paired with their indexes in all the bets.
+    :param conditions: if given, the sampling conditions under which the bets need to be processable to be sampled.
+    :return: the index of the sampled bet, or `None` if there are no bets to sample from.
+    """
+    # a single pass over the bets, keeping the highest priority bet of the first queue status that has bets in it;
+    # on equal keys, the first bet is kept, as with stable sorting
+    best_rank = len(SAMPLING_QUEUE_PRIORITY)
+    best_key: Optional[PriorityKeyType] = None
+    sampled_idx: Optional[int] = None
+    for idx, bet in bets:
+        if conditions is not None and not processable_bet(bet, conditions):
+            continue
+
+        rank = QUEUE_STATUS_RANK.get(bet.queue_status)
+        if rank is None or rank > best_rank:
+            # the priority key is relatively expensive, skip it for bets that cannot be sampled
+            continue
+
+        key = priority_key(bet)
+        if rank < best_rank or best_key is None or key > best_key:
+            best_rank, best_key, sampled_idx = rank, key, idx
+
+    return sampled_idx
 
 
 class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
@@ -44,11 +161,6 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
 
     matching_round = SamplingRound
 
-    def __init__(self, **kwargs: Any) -> None:
-        """Initialize Behaviour."""
-        super().__init__(**kwargs)
-        self.should_rebet: bool = False
-
     def setup(self) -> None:
         """Setup the behaviour."""
         self.read_bets()
@@ -63,67 +175,6 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
         """Whether to review bets for selling."""
         return self.synchronized_data.review_bets_for_selling
 
-    def processable_bet(self, bet: Bet, now: int) -> bool:
-        """Whether we can process the given bet."""
-
-        if bet.queue_status.is_expired():
-            return False
-
-        selling_specific = self.kpi_is_met and self.review_bets_for_selling
-
-        bets_placed = bool(bet.n_bets)
-        if not bets_placed and selling_specific:
-            # non-expired bet with no bets, not processable
-            self.context.logger.info(f"Bet {bet.id} has no bets")
-            return False
-
-        bet_mode_allowable = (
-            self.params.use_multi_bets_mode or not bets_placed or selling_specific
-        )
-
-        within_opening_range = bet.openingTimestamp <= (
-            now + self.params.sample_bets_closing_days * UNIX_DAY
-        )
-        within_safe_range = (
-            now
-            < bet.openingTimestamp
-            - self.params.opening_margin
-            - self.params.safe_voting_range
-        )
-        if not within_safe_range:
-            bet.blacklist_forever()
-
-        within_ranges = within_opening_range and within_safe_range
-
-        # check if bet queue number is processable
-        processable_statuses = {
-            QueueStatus.TO_PROCESS,
-            QueueStatus.PROCESSED,
-            QueueStatus.REPROCESSED,
-        }
-        bet_queue_processable = bet.queue_status in processable_statuses
-
-        return bet_mode_allowable and within_ranges and bet_queue_processable
-
-    @staticmethod
-    def _sort_by_priority_logic(bets: List[Bet]) -> List[Bet]:
-        """
-        Sort bets based on the priority logic.
-
-        :param bets: the bets to sort.
-        :return: the sorted list of bets.
-        """
-        return sorted(
-            bets,
-            key=lambda bet: (
-                bet.invested_amount,
-                -bet.processed_timestamp,  # Increasing order of processed_timestamp
-                bet.scaledLiquidityMeasure,
-                bet.openingTimestamp,
-            ),
-            reverse=True,
-        )
-
     @staticmethod
     def _get_bets_queue_wise(bets: List[Bet]) -> Tuple[List[Bet], List[Bet], List[Bet]]:
         """Return a dictionary of bets with queue status as key."""
@@ -139,40 +190,22 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
             bets_by_status[QueueStatus.REPROCESSED],
         )
 
-    def _sampled_bet_idx(self, bets: List[Bet]) -> int:
-        """
-        Sample a bet and return its index.
-
-        The sampling logic follows the specified priority logic:
-        1. Filter out all the bets that have a processed_timestamp != 0 to get a list of new bets.
-        2. If the list of new bets is not empty:
-           2.1 Order the list in decreasing order of liquidity (highest liquidity first).
-           2.2 For bets with the same liquidity, order them in decreasing order of market closing time (openingTimestamp).
-        3. If the list of new bets is empty:
-           3.1 Order the bets in decreasing order of invested_amount.
-           3.2 For bets with the same invested_amount, order them in increasing order of processed_timestamp (least recently processed first).
-           3.3 For bets with the same invested_amount and processed_timestamp, order them in decreasing order of liquidity.
-           3.4 For bets with the same invested_amount, processed_timestamp, and liquidity, order them in decreasing order of market closing time (openingTimestamp).
-
-        :param bets: the bets' values to compare for the sampling.
-        :return: the index of the sampled bet, out of all the available bets, not only the given ones.
-        """
-
-        to_process_bets, processed_bets, reprocessed_bets = self._get_bets_queue_wise(
-            bets
-        )
-
-        # pick the first queue status that has bets in it
-        bets_to_sort: List[Bet] = to_process_bets or processed_bets or reprocessed_bets
-
-        sorted_bets = self._sort_by_priority_logic(bets_to_sort)
-
-        return self.bets.index(sorted_bets[0])
-
-    def _sampling_benchmarking_bet(self, bets: List[Bet]) -> Optional[int]:
+    def _sampling_benchmarking_bet(
+        self, conditions: SamplingConditions
+    ) -> Optional[int]:
         """Sample bet for benchmarking"""
+        available_bets = [
+            (idx, bet)
+            for idx, bet in enumerate(self.bets)
+            if processable_bet(bet, conditions)
+        ]
+        if len(available_bets) == 0:
+            msg = "There were no unprocessed bets available to sample from!"
+            self.context.logger.warning(msg)
+            return None
+
         to_process_bets, processed_bets, reprocessed_bets = self._get_bets_queue_wise(
-            bets
+            [bet for _, bet in available_bets]
         )
 
         self.context.logger.info(f"TO_PROCESS_LEN: {len(to_process_bets)}")
@@ -189,44 +222,51 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
         ):
             return None
 
-        bets_to_sort: List[Bet] = to_process_bets or processed_bets or reprocessed_bets
-        sorted_bets = self._sort_by_priority_logic(bets_to_sort)
+        # the available bets are already filtered, so they are not checked against the conditions again
+        return sampled_bet_idx(available_bets)
 
-        return self.bets.index(sorted_bets[0])
+    def _sample(self, benchmarking_enabled: bool) -> Optional[int]:
+        """
+        Sample a bet, mark it as processed, and return its index.
 
-    def _sample(self) -> Optional[int]:
-        """Sample a bet, mark it as processed, and return its index."""
+        :param benchmarking_enabled: whether the benchmarking mode is enabled.
+        :return: the index of the sampled bet, or `None` if no bet could be sampled.
+        """
+        params = self.params
+        safe_voting_range = params.opening_margin + params.safe_voting_range
         # modify time "NOW" in benchmarking mode
-        if self.benchmarking_mode.enabled:
-            safe_voting_range = (
-                self.params.opening_margin + self.params.safe_voting_range
-            )
+        if benchmarking_enabled:
             now = self.shared_state.get_simulated_now_timestamp(
                 self.bets, safe_voting_range
             )
-            self.context.logger.info(f"Simulating date: {datetime.fromtimestamp(now)}")
+            self.context.logger.info("Simulating date: %s", datetime.fromtimestamp(now))
         else:
             now = self.synced_timestamp
 
-        # filter in only the bets that are processable and have a queue_status that allows them to be sampled
-        available_bets = list(
-            filter(
-                lambda bet: self.processable_bet(bet, now=now),
-                self.bets,
-            )
+        # the conditions are the same for all the bets, so they are only computed once
+        conditions = SamplingConditions(
+            opening_cutoff=now + params.sample_bets_closing_days * UNIX_DAY,
+            safe_cutoff=now + safe_voting_range,
+            selling_specific=self.kpi_is_met and self.review_bets_for_selling,
+            multi_bets_mode=params.use_multi_bets_mode,
         )
-        if len(available_bets) == 0:
-            msg = "There were no unprocessed bets available to sample from!"
-            self.context.logger.warning(msg)
-            return None
+        if conditions.selling_specific:
+            self.context.logger.info(
+                "Reviewing bets for selling. Bets without any placed bets are not processable."
+            )
 
-        if self.benchmarking_mode.enabled:
-            idx = self._sampling_benchmarking_bet(available_bets)
-            if not idx:
+        if benchmarking_enabled:
+            idx = self._sampling_benchmarking_bet(conditions)
+            if idx is None:
+                return None
+        else:
+            # sample a bet out of the ones that are processable and have a queue_status that allows them to be sampled
+            idx = sampled_bet_idx(enumerate(self.bets), conditions)
+            if idx is None:
+                msg = "There were no unprocessed bets available to sample from!"
+                self.context.logger.warning(msg)
                 return None
 
-        # sample a bet using the priority logic
-        idx = self._sampled_bet_idx(available_bets)
         sampled_bet = self.bets[idx]
 
         # fetch the liquidity of the sampled bet and cache it
@@ -237,8 +277,8 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
             return None
         self.shared_state.liquidity_cache[sampled_bet.id] = liquidity
 
-        msg = f"Sampled bet: {sampled_bet}"
-        self.context.logger.info(msg)
+        # the bet's representation walks all of its fields, so defer it to the logger
+        self.context.logger.info("Sampled bet: %s", sampled_bet)
         return idx
 
     def _benchmarking_inc_day(self) -> Tuple[bool, bool]:
@@ -260,12 +300,13 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
     def async_act(self) -> Generator:
         """Do the action."""
         with self.context.benchmark_tool.measure(self.behaviour_id).local():
-            idx = self._sample()
+            benchmarking_enabled = self.benchmarking_mode.enabled
+            idx = self._sample(benchmarking_enabled)
             benchmarking_finished = None
             day_increased = None
 
             # day increase simulation and benchmarking finished check
-            if idx is None and self.benchmarking_mode.enabled:
+            if idx is None and benchmarking_enabled:
                 benchmarking_finished, day_increased = self._benchmarking_inc_day()
                 for bet in self.bets:
                     bet.queue_status = bet.queue_status.move_to_fresh()
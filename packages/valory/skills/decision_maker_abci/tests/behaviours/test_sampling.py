@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests for valory/decision_maker_abci's sampling behaviour."""
+
+import sys
+from typing import List, Optional
+
+import pytest
+
+from packages.valory.skills.decision_maker_abci.behaviours.sampling import (
+    SamplingConditions,
+    processable_bet,
+    sampled_bet_idx,
+)
+from packages.valory.skills.market_manager_abci.bets import Bet, QueueStatus
+from packages.valory.skills.market_manager_abci.tests.conftest import (
+    DUMMY_OPENING_TIMESTAMP,
+    get_dummy_bet,
+)
+
+
+CONDITIONS = SamplingConditions(
+    opening_cutoff=DUMMY_OPENING_TIMESTAMP + 100,
+    safe_cutoff=DUMMY_OPENING_TIMESTAMP - 100,
+    selling_specific=False,
+    multi_bets_mode=True,
+)
+
+
+@pytest.mark.parametrize(
+    "bets, expected",
+    (
+        pytest.param([], None, id="no bets"),
+        pytest.param(
+            [
+                get_dummy_bet(queue_status=QueueStatus.EXPIRED),
+                get_dummy_bet(queue_status=QueueStatus.FRESH),
+                get_dummy_bet(
+                    queue_status=QueueStatus.TO_PROCESS,
+                    opening_timestamp=DUMMY_OPENING_TIMESTAMP + 1000,
+                ),
+            ],
+            None,
+            id="no processable bets",
+        ),
+        pytest.param(
+            [
+                get_dummy_bet(queue_status=QueueStatus.REPROCESSED, invested_amount=10),
+                get_dummy_bet(queue_status=QueueStatus.PROCESSED, invested_amount=5),
+                get_dummy_bet(queue_status=QueueStatus.TO_PROCESS, liquidity=0.1),
+                get_dummy_bet(queue_status=QueueStatus.PROCESSED, invested_amount=20),
+            ],
+            2,
+            id="to process bets take precedence",
+        ),
+        pytest.param(
+            [
+                get_dummy_bet(queue_status=QueueStatus.REPROCESSED, invested_amount=10),
+                get_dummy_bet(
+                    queue_status=QueueStatus.PROCESSED, processed_timestamp=5
+                ),
+                get_dummy_bet(
+                    queue_status=QueueStatus.PROCESSED, processed_timestamp=2
+                ),
+            ],
+            2,
+            id="processed bets take precedence over reprocessed",
+        ),
+        pytest.param(
+            [
+                get_dummy_bet(queue_status=QueueStatus.TO_PROCESS, liquidity=1.0),
+                get_dummy_bet(queue_status=QueueStatus.TO_PROCESS, liquidity=2.0),
+                get_dummy_bet(
+                    queue_status=QueueStatus.TO_PROCESS,
+                    liquidity=2.0,
+                    opening_timestamp=DUMMY_OPENING_TIMESTAMP + 1,
+                ),
+                get_dummy_bet(queue_status=QueueStatus.TO_PROCESS, invested_amount=1),
+            ],
+            3,
+            id="priority key order",
+        ),
+        pytest.param(
+            [
+                get_dummy_bet(queue_status=QueueStatus.TO_PROCESS, liquidity=1.0),
+                get_dummy_bet(queue_status=QueueStatus.TO_PROCESS, liquidity=2.0),
+                get_dummy_bet(queue_status=QueueStatus.TO_PROCESS, liquidity=2.0),
+            ],
+            1,
+            id="first bet kept on ties",
+        ),
+    ),
+)
+def test_sampled_bet_idx(bets: List[Bet], expected: Optional[int]) -> None:
+    """Test the `sampled_bet_idx` function."""
+    assert sampled_bet_idx(enumerate(bets), CONDITIONS) == expected
+
+
+def test_sampled_bet_idx_without_conditions() -> None:
+    """Test that the `sampled_bet_idx` function does not filter the bets if no conditions are given."""
+    bets = [
+        get_dummy_bet(
+            queue_status=QueueStatus.TO_PROCESS,
+            opening_timestamp=DUMMY_OPENING_TIMESTAMP + 1000,
+        )
+    ]
+    assert sampled_bet_idx(enumerate(bets), CONDITIONS) is None
+    assert sampled_bet_idx(enumerate(bets)) == 0
+
+
+def test_sampled_bet_idx_skips_unsampled_statuses() -> None:
+    """Test that the bets with a queue status that cannot be sampled are skipped even if no conditions are given."""
+    bets = [
+        get_dummy_bet(queue_status=QueueStatus.FRESH),
+        get_dummy_bet(queue_status=QueueStatus.EXPIRED),
+    ]
+    assert sampled_bet_idx(enumerate(bets)) is None
+
+    bets.append(get_dummy_bet(queue_status=QueueStatus.REPROCESSED))
+    assert sampled_bet_idx(enumerate(bets)) == 2
+
+
+def test_out_of_safe_range_bets_are_blacklisted() -> None:
+    """Test that the bets outside the safe voting range are blacklisted while sampling."""
+    unsafe_bet = get_dummy_bet(
+        queue_status=QueueStatus.TO_PROCESS, opening_timestamp=CONDITIONS.safe_cutoff
+    )
+    safe_bet = get_dummy_bet(queue_status=QueueStatus.TO_PROCESS, liquidity=0.1)
+    bets = [unsafe_bet, safe_bet]
+
+    assert sampled_bet_idx(enumerate(bets), CONDITIONS) == 1
+    assert unsafe_bet.queue_status is QueueStatus.EXPIRED
+    assert unsafe_bet.processed_timestamp == sys.maxsize
+    assert safe_bet.queue_status is QueueStatus.TO_PROCESS
+    assert not processable_bet(unsafe_bet, CONDITIONS)
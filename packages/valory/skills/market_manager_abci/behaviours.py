@@ -35,6 +35,7 @@ from packages.valory.skills.market_manager_abci.bets import (
     BetsDecoder,
     BinaryOutcome,
     serialize_bets,
+    truncated_bets_repr,
 )
 from packages.valory.skills.market_manager_abci.graph_tooling.requests import (
     FetchStatus,
@@ -59,6 +60,7 @@ BETS_FILENAME = "bets.json"
 MULTI_BETS_FILENAME = "multi_bets.json"
 READ_MODE = "r"
 WRITE_MODE = "w"
+TMP_SUFFIX = ".tmp"
 
 
 class BetsManagerBehaviour(BaseBehaviour, ABC):
@@ -70,6 +72,8 @@ class BetsManagerBehaviour(BaseBehaviour, ABC):
         self.bets: List[Bet] = []
         self.multi_bets_filepath: str = self.params.store_path / MULTI_BETS_FILENAME
         self.bets_filepath: str = self.params.store_path / BETS_FILENAME
+        # the serialized bets that were last written to the bets' file by this behaviour
+        self.stored_bets: Optional[str] = None
 
     @property
     def shared_state(self) -> SharedState:
@@ -81,22 +85,60 @@ class BetsManagerBehaviour(BaseBehaviour, ABC):
         """Return the benchmarking mode configurations."""
         return cast(BenchmarkingMode, self.context.benchmarking_mode)
 
+    def _is_stored(self, serialized: str) -> bool:
+        """Whether the bets' file already contains exactly the given serialized bets."""
+        try:
+            # the serialized bets are ASCII, so a different file size means different bets
+            if os.path.getsize(self.multi_bets_filepath) != len(serialized):
+                return False
+            with open(self.multi_bets_filepath, READ_MODE) as bets_file:
+                return bets_file.read() == serialized
+        except (OSError, UnicodeDecodeError):
+            return False
+
     def store_bets(self) -> None:
         """Store the bets to the agent's data dir as JSON."""
+        self.stored_bets = None
         serialized = serialize_bets(self.bets)
         if serialized is None:
             self.context.logger.warning("No bets to store.")
             return
 
+        # reading the file back is much cheaper than rewriting and syncing it when the bets have not changed
+        if self._is_stored(serialized):
+            self.stored_bets = serialized
+            return
+
+        # the bets are written to a temporary file first, which then atomically replaces the stored bets,
+        # so that a failure while writing never leaves the bets' file partially written
+        tmp_filepath = f"{self.multi_bets_filepath}{TMP_SUFFIX}"
         try:
-            with open(self.multi_bets_filepath, WRITE_MODE) as bets_file:
+            with open(tmp_filepath, WRITE_MODE) as bets_file:
                 try:
                     bets_file.write(serialized)
-                    return
+                    bets_file.flush()
+                    os.fsync(bets_file.fileno())
+                    written = True
                 except (IOError, OSError):
                     err = f"Error writing to file {self.multi_bets_filepath!r}!"
+                    written = False
         except (FileNotFoundError, PermissionError, OSError):
             err = f"Error opening file {self.multi_bets_filepath!r} in write mode!"
+            written = False
+
+        if written:
+            try:
+                os.replace(tmp_filepath, self.multi_bets_filepath)
+                self.stored_bets = serialized
+                return
+            except OSError:
+                err = f"Error replacing file {self.multi_bets_filepath!r}!"
+
+        # do not leave a partially written temporary file behind
+        try:
+            os.remove(tmp_filepath)
+        except OSError:
+            pass
 
         self.context.logger.error(err)
 
@@ -132,7 +174,15 @@ class BetsManagerBehaviour(BaseBehaviour, ABC):
 
     def hash_stored_bets(self) -> str:
         """Get the hash of the stored bets' file."""
-        return IPFSHashOnly.hash_file(self.multi_bets_filepath)
+        stored_bets = self.stored_bets
+        if stored_bets is None:
+            return IPFSHashOnly.hash_file(self.multi_bets_filepath)
+
+        # the stored bets are still in memory, so hash them directly instead of reading them back from the file
+        return IPFSHashOnly.hash_bytes(
+            stored_bets.encode(),
+            file_name_if_wrap=os.path.basename(self.multi_bets_filepath),
+        )
 
 
 class UpdateBetsBehaviour(BetsManagerBehaviour, QueryingBehaviour):
@@ -144,11 +194,6 @@ class UpdateBetsBehaviour(BetsManagerBehaviour, QueryingBehaviour):
         """Initialize `UpdateBetsBehaviour`."""
         super().__init__(**kwargs)
 
-    def _requeue_all_bets(self) -> None:
-        """Requeue all bets."""
-        for bet in self.bets:
-            bet.queue_status = bet.queue_status.move_to_fresh()
-
     def _requeue_bets_for_selling(self) -> None:
         """Requeue sell bets."""
         for bet in self.bets:
@@ -169,10 +214,22 @@ class UpdateBetsBehaviour(BetsManagerBehaviour, QueryingBehaviour):
                 )
                 bet.queue_status = bet.queue_status.move_to_fresh()
 
-    def _blacklist_expired_bets(self) -> None:
-        """Blacklist bets that are older than the opening margin."""
+    def _requeue_and_blacklist_expired_bets(self, requeue: bool) -> None:
+        """
+        Requeue all bets if requested, and blacklist the bets that are older than the opening margin, in a single pass.
+
+        :param requeue: whether to requeue all the bets.
+        """
+        # the synced time is not available before the first round transition, when there are no bets yet
+        if not self.bets:
+            return
+
+        # the bets opening up to this timestamp are within the opening margin; it is the same for all the bets
+        blacklisting_cutoff = self.synced_time + self.params.opening_margin
         for bet in self.bets:
-            if self.synced_time >= bet.openingTimestamp - self.params.opening_margin:
+            if requeue:
+                bet.queue_status = bet.queue_status.move_to_fresh()
+            if bet.openingTimestamp <= blacklisting_cutoff:
                 bet.blacklist_forever()
 
     def review_bets_for_selling(self) -> bool:
@@ -229,17 +286,15 @@ class UpdateBetsBehaviour(BetsManagerBehaviour, QueryingBehaviour):
         )
 
         # fetch checkpoint status and if reached requeue all bets
-        if (
+        requeue = (
             self.synchronized_data.is_checkpoint_reached
             and self.params.use_multi_bets_mode
-        ):
-            self._requeue_all_bets()
+        )
 
         # blacklist bets that are older than the opening margin
         # if trader ran after a long time
         # helps in resetting the queue number to 0
-        if self.bets:
-            self._blacklist_expired_bets()
+        self._requeue_and_blacklist_expired_bets(requeue)
 
     def get_bet_idx(self, bet_id: str) -> Optional[int]:
         """Get the index of the bet with the given id, if it exists, otherwise `None`."""
@@ -250,10 +305,17 @@ class UpdateBetsBehaviour(BetsManagerBehaviour, QueryingBehaviour):
         if chunk is None:
             return
 
+        # map each bet's id to its index once, instead of scanning the bets for every raw bet;
+        # the first index is kept for duplicate ids, as with `get_bet_idx`
+        idx_by_id: Dict[str, int] = {}
+        for i, existing_bet in enumerate(self.bets):
+            idx_by_id.setdefault(existing_bet.id, i)
+
         for raw_bet in chunk:
             bet = Bet(**raw_bet, market=self._current_market)
-            index = self.get_bet_idx(bet.id)
+            index = idx_by_id.get(bet.id)
             if index is None:
+                idx_by_id[bet.id] = len(self.bets)
                 self.bets.append(bet)
             else:
                 self.bets[index].update_market_info(bet)
@@ -277,7 +339,7 @@ class UpdateBetsBehaviour(BetsManagerBehaviour, QueryingBehaviour):
             self.bets = []
 
         # truncate the bets, otherwise logs get too big
-        bets_str = str(self.bets)[:MAX_LOG_SIZE]
+        bets_str = truncated_bets_repr(self.bets, MAX_LOG_SIZE)
         self.context.logger.info(f"Updated bets: {bets_str}")
 
     def _bet_freshness_check_and_update(self) -> None:
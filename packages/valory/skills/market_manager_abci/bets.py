@@ -25,7 +25,7 @@ import dataclasses
 import json
 import sys
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 
 P_YES_FIELD = "p_yes"
@@ -130,6 +130,25 @@ class PredictionResponse:
         return max(self.p_no, self.p_yes)
 
 
+def get_casts(annotations: Dict[str, Any]) -> Tuple[Tuple[str, type, bool], ...]:
+    """
+    Get the casts to apply to the fields with the given type annotations.
+
+    :param annotations: the type annotations of the fields.
+    :return: the fields to cast, each with the type to cast to and whether the field is a list of that type.
+    """
+    types_to_cast = ("int", "float", "str")
+    str_to_type = {getattr(builtins, type_): type_ for type_ in types_to_cast}
+    casts = []
+    for field, hinted_type in annotations.items():
+        for type_to_cast, type_name in str_to_type.items():
+            if hinted_type == type_to_cast:
+                casts.append((field, type_to_cast, False))
+            if f"{str(List)}[{type_name}]" == str(hinted_type):
+                casts.append((field, type_to_cast, True))
+    return tuple(casts)
+
+
 def get_default_prediction_response() -> PredictionResponse:
     """Get the default prediction response."""
     return PredictionResponse(p_yes=0.5, p_no=0.5, confidence=0.5, info_utility=0.5)
@@ -260,18 +279,16 @@ class Bet:
 
     def _cast(self) -> None:
         """Cast the values of the instance."""
-        types_to_cast = ("int", "float", "str")
-        str_to_type = {getattr(builtins, type_): type_ for type_ in types_to_cast}
-        for field, hinted_type in self.__annotations__.items():
+        # the casts are derived from the type annotations only once, as inspecting them is expensive
+        for field, type_to_cast, is_list in BET_CASTS:
             uncasted = getattr(self, field)
             if uncasted is None:
                 continue
 
-            for type_to_cast, type_name in str_to_type.items():
-                if hinted_type == type_to_cast:
-                    setattr(self, field, hinted_type(uncasted))
-                if f"{str(List)}[{type_name}]" == str(hinted_type):
-                    setattr(self, field, list(type_to_cast(val) for val in uncasted))
+            if is_list:
+                setattr(self, field, [type_to_cast(val) for val in uncasted])
+            else:
+                setattr(self, field, type_to_cast(uncasted))
 
     def _check_usefulness(self) -> None:
         """If the bet is deemed unhelpful, then blacklist it."""
@@ -398,13 +415,23 @@ class Bet:
         )
 
 
+# the attributes of the decoded objects, used to recognize them when decoding the bets
+PREDICTION_RESPONSE_ATTRIBUTES = frozenset(PredictionResponse.__annotations__)
+BET_ATTRIBUTES = frozenset(Bet.__annotations__)
+# the casts applied to the bets' values when they are initialized
+BET_CASTS = get_casts(Bet.__annotations__)
+
+
 class BetsEncoder(json.JSONEncoder):
     """JSON encoder for bets."""
 
     def default(self, o: Any) -> Any:
         """The default encoder."""
         if dataclasses.is_dataclass(o) and not isinstance(o, type):
-            return dataclasses.asdict(o)
+            # a shallow conversion, as the encoder visits the nested values itself, unlike the deep copy of `asdict`
+            return {
+                field.name: getattr(o, field.name) for field in dataclasses.fields(o)
+            }
         if isinstance(o, QueueStatus):
             return o.value
         return super().default(o)
@@ -421,20 +448,18 @@ class BetsDecoder(json.JSONDecoder):
     def hook(data: Dict[str, Any]) -> Union[Bet, PredictionResponse, Dict[str, Bet]]:
         """Perform the custom decoding."""
         # if this is a `PredictionResponse`
-        prediction_attributes = sorted(PredictionResponse.__annotations__.keys())
-        data_attributes = sorted(data.keys())
-        if prediction_attributes == data_attributes:
+        data_attributes = data.keys()
+        if data_attributes == PREDICTION_RESPONSE_ATTRIBUTES:
             return PredictionResponse(**data)
 
         # if this is a `Bet`
-        bet_annotations = sorted(Bet.__annotations__.keys())
-        if bet_annotations == data_attributes:
+        if data_attributes == BET_ATTRIBUTES:
             data["queue_status"] = QueueStatus(data["queue_status"])
             return Bet(**data)
         # if the data contains an id key, but does not match the bet attributes exactly, process it as a bet
         elif "id" in data_attributes:
             # Extract only the attributes that exist in both Bet and data to ensure compatibility
-            common_attributes = set(bet_annotations) & set(data_attributes)
+            common_attributes = BET_ATTRIBUTES & data_attributes
             data = {key: data[key] for key in common_attributes}
             # Convert queue_status to a QueueStatus enum if present in data
             if "queue_status" in data:
@@ -448,3 +473,27 @@ def serialize_bets(bets: List[Bet]) -> Optional[str]:
     if len(bets) == 0:
         return None
     return json.dumps(bets, cls=BetsEncoder)
+
+
+def truncated_bets_repr(bets: List[Bet], max_size: int) -> str:
+    """
+    Get the representation of the bets, truncated to the given size.
+
+    The result is the same as `str(bets)[:max_size]`, but only the bets that fit in the given size are represented.
+
+    :param bets: the bets to represent.
+    :param max_size: the maximum size of the representation.
+    :return: the truncated representation of the bets.
+    """
+    parts = ["["]
+    size = 1
+    for i, bet in enumerate(bets):
+        if size >= max_size:
+            break
+        part = repr(bet) if i == 0 else f", {bet!r}"
+        parts.append(part)
+        size += len(part)
+    else:
+        parts.append("]")
+
+    return "".join(parts)[:max_size]
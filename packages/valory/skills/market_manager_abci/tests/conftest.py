@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Conftest module for market manager tests."""
+
+from packages.valory.skills.market_manager_abci.bets import Bet, QueueStatus
+
+
+DUMMY_OPENING_TIMESTAMP = 1754092800
+DUMMY_LIQUIDITY = 5.888381051174862
+
+
+def get_dummy_bet(
+    bet_id: str = "0x0",
+    queue_status: QueueStatus = QueueStatus.FRESH,
+    invested_amount: int = 0,
+    processed_timestamp: int = 0,
+    liquidity: float = DUMMY_LIQUIDITY,
+    opening_timestamp: int = DUMMY_OPENING_TIMESTAMP,
+) -> Bet:
+    """Get a dummy bet with the given values."""
+    return Bet(
+        id=bet_id,
+        market="omen_subgraph",
+        title="Dummy question?",
+        collateralToken="0xe91d153e0b41518a2ce8dd3d7944fa863463a97d",  # nosec
+        creator="0x89c5cc945dd550bcffb72fe42bff002429f46fec",
+        fee=10000000000000000,
+        openingTimestamp=opening_timestamp,
+        outcomeSlotCount=2,
+        outcomeTokenAmounts=[12821128072452298989, 3821816592354479467],
+        outcomeTokenMarginalPrices=[0.2296358408518959, 0.7703641591481041],
+        outcomes=["Yes", "No"],
+        scaledLiquidityMeasure=liquidity,
+        processed_timestamp=processed_timestamp,
+        queue_status=queue_status,
+        investments={"Yes": [invested_amount] if invested_amount else [], "No": []},
+    )
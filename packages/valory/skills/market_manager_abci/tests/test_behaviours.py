@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2025 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the behaviours of the MarketManager ABCI application."""
+
+from pathlib import Path
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+from aea.helpers.ipfs.base import IPFSHashOnly
+
+from packages.valory.skills.market_manager_abci.behaviours import (
+    MULTI_BETS_FILENAME,
+    UpdateBetsBehaviour,
+)
+from packages.valory.skills.market_manager_abci.bets import Bet
+from packages.valory.skills.market_manager_abci.tests.conftest import get_dummy_bet
+
+
+def _bets_manager(store_path: Path, bets: List[Bet]) -> UpdateBetsBehaviour:
+    """Get a bets manager behaviour storing the given bets under the given path, with a mocked skill context."""
+    skill_context = MagicMock()
+    skill_context.params.store_path = store_path
+    behaviour = UpdateBetsBehaviour(
+        name=UpdateBetsBehaviour.auto_behaviour_id(), skill_context=skill_context
+    )
+    behaviour.bets = bets
+    return behaviour
+
+
+def test_bets_manager_init(tmp_path: Path) -> None:
+    """Test that the bets manager stores the bets under the store path and has not stored any bets yet."""
+    behaviour = _bets_manager(tmp_path, [])
+    assert behaviour.multi_bets_filepath == tmp_path / MULTI_BETS_FILENAME
+    assert behaviour.stored_bets is None
+
+
+@pytest.mark.parametrize("n_bets", (1, 3))
+def test_hash_stored_bets(tmp_path: Path, n_bets: int) -> None:
+    """Test that the hash of the stored bets is the hash of the bets' file."""
+    behaviour = _bets_manager(
+        tmp_path, [get_dummy_bet(f"0x{i}") for i in range(n_bets)]
+    )
+    behaviour.store_bets()
+
+    assert behaviour.stored_bets is not None
+    assert behaviour.hash_stored_bets() == IPFSHashOnly.hash_file(
+        behaviour.multi_bets_filepath
+    )
+
+
+def test_hash_stored_bets_when_not_stored(tmp_path: Path) -> None:
+    """Test that the bets' file is hashed when the bets have not been stored by the behaviour."""
+    behaviour = _bets_manager(tmp_path, [get_dummy_bet("0x0")])
+    behaviour.store_bets()
+    behaviour.stored_bets = None
+
+    assert behaviour.hash_stored_bets() == IPFSHashOnly.hash_file(
+        behaviour.multi_bets_filepath
+    )
+
+
+def test_is_stored(tmp_path: Path) -> None:
+    """Test that only the exact same content is considered stored."""
+    behaviour = _bets_manager(tmp_path, [get_dummy_bet("0x0")])
+    assert not behaviour._is_stored("[]")
+
+    behaviour.store_bets()
+    serialized = behaviour.stored_bets
+    assert serialized is not None
+    assert behaviour._is_stored(serialized)
+
+    same_size = serialized.replace("0x0", "0x1")
+    assert len(same_size) == len(serialized)
+    assert not behaviour._is_stored(same_size)
+    assert not behaviour._is_stored(serialized[:-1])
+
+
+def test_store_bets_skips_rewriting(tmp_path: Path) -> None:
+    """Test that the bets' file is only rewritten when the bets have changed."""
+    behaviour = _bets_manager(tmp_path, [get_dummy_bet("0x0")])
+    behaviour.store_bets()
+    filepath = Path(behaviour.multi_bets_filepath)
+    stat = filepath.stat()
+
+    behaviour.store_bets()
+    assert filepath.stat().st_ino == stat.st_ino
+    assert filepath.stat().st_mtime_ns == stat.st_mtime_ns
+
+    # a bet of the same size makes the file's content different, so it has to be rewritten
+    behaviour.bets = [get_dummy_bet("0x1")]
+    behaviour.store_bets()
+    assert filepath.stat().st_ino != stat.st_ino
+    assert filepath.read_text() == behaviour.stored_bets
+    assert not Path(f"{filepath}.tmp").exists()
@@ -18,7 +18,7 @@
 # ------------------------------------------------------------------------------
 """This module contains the tests for the utils of the MarketManager ABCI application."""
 
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
 import pytest
 
@@ -26,8 +26,11 @@ from packages.valory.skills.market_manager_abci.bets import (
     Bet,
     PredictionResponse,
     QueueStatus,
+    get_casts,
     serialize_bets,
+    truncated_bets_repr,
 )
+from packages.valory.skills.market_manager_abci.tests.conftest import get_dummy_bet
 
 
 @pytest.mark.parametrize(
@@ -65,3 +68,42 @@ from packages.valory.skills.market_manager_abci.bets import (
 def test_serialize_bets(bets: List[Bet], expected: str) -> None:
     """Test the serialize_bets function."""
     assert serialize_bets(bets) == expected
+
+
+@pytest.mark.parametrize("n_bets", (0, 1, 3))
+@pytest.mark.parametrize("max_size", (0, 1, 2, 10, 1000, 100000))
+def test_truncated_bets_repr(n_bets: int, max_size: int) -> None:
+    """Test the truncated_bets_repr function."""
+    bets = [get_dummy_bet(f"0x{i}") for i in range(n_bets)]
+    assert truncated_bets_repr(bets, max_size) == str(bets)[:max_size]
+
+
+@pytest.mark.parametrize(
+    "annotations, expected",
+    [
+        (
+            {
+                "a": int,
+                "b": float,
+                "c": str,
+                "d": List[int],
+                "e": List[float],
+                "f": Optional[List[str]],
+                "g": Dict[str, List[int]],
+                "h": QueueStatus,
+            },
+            (
+                ("a", int, False),
+                ("b", float, False),
+                ("c", str, False),
+                ("d", int, True),
+                ("e", float, True),
+            ),
+        ),
+    ],
+)
+def test_get_casts(
+    annotations: Dict[str, Any], expected: Tuple[Tuple[str, type, bool], ...]
+) -> None:
+    """Test the get_casts function."""
+    assert get_casts(annotations) == expected